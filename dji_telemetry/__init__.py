@@ -5,7 +5,7 @@ A Python library to parse DJI drone SRT telemetry files and overlay
 flight data onto video footage.
 
 Basic usage:
-    from dji_telemetry import parse_srt, process_video
+    from dji_telemetry import parse_srt, process_video, process_video_ffmpeg
 
     # Parse telemetry
     telemetry = parse_srt('video.SRT')
@@ -13,6 +13,9 @@ Basic usage:
     # Process video with overlay
     process_video('video.MP4', telemetry, 'output.mp4')
 
+    # Or let ffmpeg composite and keep the original audio in one pass
+    process_video_ffmpeg('video.MP4', telemetry, 'output.mp4', audio=True)
+
 Export telemetry data:
     from dji_telemetry import parse_srt, export
 
@@ -22,13 +25,17 @@ Export telemetry data:
     export(telemetry, 'telemetry.gpx')
 """
 
+import importlib
+
 __version__ = '1.0.1'
 
 # Core parser
 from .parser import (
     parse_srt,
+    parse_srt_summary,
     TelemetryFrame,
     TelemetryData,
+    TelemetrySummary,
 )
 
 # Exporters
@@ -39,29 +46,49 @@ from .exporter import (
     to_gpx,
 )
 
-# Overlay rendering
-from .overlay import (
-    OverlayConfig,
-    OverlayRenderer,
-    create_transparent_frame,
-)
+# Overlay rendering and video processing depend on OpenCV, so they are
+# imported on first attribute access rather than with the package
+_LAZY_IMPORTS = {
+    # Overlay rendering
+    'OverlayConfig': '.overlay',
+    'OverlayRenderer': '.overlay',
+    'create_transparent_frame': '.overlay',
+    'precompute_labels': '.overlay',
+    # Video processing
+    'process_video': '.video',
+    'process_video_ffmpeg': '.video',
+    'generate_overlay_video': '.video',
+    'generate_overlay_frames': '.video',
+    'open_ffmpeg_writer': '.video',
+    'has_encoder': '.video',
+    'add_audio': '.video',
+    'get_video_info': '.video',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Video processing
-from .video import (
-    process_video,
-    generate_overlay_video,
-    generate_overlay_frames,
-    add_audio,
-    get_video_info,
-)
 
 __all__ = [
     # Version
     '__version__',
     # Parser
     'parse_srt',
+    'parse_srt_summary',
     'TelemetryFrame',
     'TelemetryData',
+    'TelemetrySummary',
     # Exporters
     'export',
     'to_csv',
@@ -71,10 +98,14 @@ __all__ = [
     'OverlayConfig',
     'OverlayRenderer',
     'create_transparent_frame',
+    'precompute_labels',
     # Video
     'process_video',
+    'process_video_ffmpeg',
     'generate_overlay_video',
     'generate_overlay_frames',
+    'open_ffmpeg_writer',
+    'has_encoder',
     'add_audio',
     'get_video_info',
 ]
@@ -0,0 +1,280 @@
+"""
+Batched file writes through io_uring.
+
+Only available on Linux with the optional ``liburing`` package installed and
+a kernel that allows io_uring; callers should check ``available()`` and fall
+back to regular file I/O.
+"""
+
+import io
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+# Writes kept in flight before waiting for completions
+QUEUE_DEPTH = 64
+
+# Size of each registered (fixed) write buffer; a multiple of the page size.
+# Fixed writes always cover a whole buffer, so they only pay off for large
+# streamed writes such as UringFile's buffered chunks, not per-file writes.
+FIXED_BUFFER_SIZE = 128 * 1024
+
+
+@lru_cache(maxsize=None)
+def available() -> bool:
+    """
+    Whether io_uring writes can be used on this system.
+
+    Besides Linux and liburing this needs a kernel that lets us create a
+    ring: old kernels, kernel.io_uring_disabled and container seccomp
+    profiles refuse it, so a ring is set up and torn down once to find out.
+    """
+    if not sys.platform.startswith('linux') or liburing is None:
+        return False
+
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(1, ring, 0)
+    except OSError:
+        return False
+    liburing.io_uring_queue_exit(ring)
+    return True
+
+
+class UringWriter:
+    """
+    Submit file writes to an io_uring and reap their completions in batches.
+
+    Writes are queued without a syscall each; the queue is submitted and
+    drained once QUEUE_DEPTH writes are in flight, and fully on flush().
+
+    With fixed_buffers, a pool of buffer_size buffers is registered with the
+    ring once, so full-sized blocks of each write are copied into it and
+    submitted as fixed writes without the kernel pinning pages per request.
+    Only the remaining tail of a write goes through a regular write. Data is
+    copied before submit_write() returns, so the caller may reuse its buffer.
+
+    Example:
+        with UringWriter() as writer:
+            writer.write_file('frame_000000.png', png_bytes)
+    """
+
+    def __init__(
+        self,
+        queue_depth: int = QUEUE_DEPTH,
+        fixed_buffers: bool = False,
+        buffer_size: int = FIXED_BUFFER_SIZE
+    ):
+        if not available():
+            raise OSError("io_uring writes require Linux, the liburing package and "
+                          "a kernel that allows io_uring")
+
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(queue_depth, self._ring, 0)
+
+        self.queue_depth = queue_depth
+        self.buffer_size = buffer_size
+        self._inflight = {}  # user_data -> (fd, buf, offset, buffer index or None)
+        self._pending_fds = {}  # fd -> writes in flight, closed when it drops to 0
+        self._next_id = 0
+        self._error: Optional[OSError] = None
+        self._closed = False
+
+        self._buffers = []
+        if fixed_buffers:
+            self._buffers = [bytearray(buffer_size) for _ in range(queue_depth)]
+            try:
+                liburing.io_uring_register_buffers(self._ring, liburing.Iovec(self._buffers))
+            except OSError:
+                # Usually RLIMIT_MEMLOCK; plain writes still work
+                self._buffers = []
+        self._free_buffers = list(range(len(self._buffers)))
+
+    def _submit(self, fd: int, buf: bytes, offset: int, buf_index: Optional[int] = None):
+        """Queue a single write SQE, waiting for completions if the ring is full."""
+        if len(self._inflight) >= self.queue_depth:
+            self._reap(1)
+
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        if buf_index is None:
+            liburing.io_uring_prep_write(sqe, fd, buf, offset)
+        else:
+            liburing.io_uring_prep_write_fixed(sqe, fd, buf, buf_index, offset)
+        liburing.io_uring_sqe_set_data64(sqe, self._next_id)
+        self._inflight[self._next_id] = (fd, buf, offset, buf_index)
+        self._next_id += 1
+
+        if fd in self._pending_fds:
+            self._pending_fds[fd] += 1
+
+    def _acquire_buffer(self) -> int:
+        """Take a free registered buffer, reaping completions until one is released."""
+        while not self._free_buffers:
+            self._reap(1)
+        return self._free_buffers.pop()
+
+    def submit_write(self, fd: int, data, offset: int = 0):
+        """Queue a write of data (any bytes-like object) to fd at offset."""
+        view = memoryview(data).cast('B')
+        pos = 0
+
+        # Fixed writes always cover a whole registered buffer, so only full blocks use them
+        if self._buffers:
+            while len(view) - pos >= self.buffer_size:
+                buf_index = self._acquire_buffer()
+                buf = self._buffers[buf_index]
+                buf[:] = view[pos:pos + self.buffer_size]
+                self._submit(fd, buf, offset + pos, buf_index)
+                pos += self.buffer_size
+
+        if pos < len(view):
+            tail = data if pos == 0 and type(data) is bytes else bytes(view[pos:])
+            self._submit(fd, tail, offset + pos)
+
+    def write_file(self, path: str | Path, data):
+        """Create (or truncate) path and queue data to be written to it."""
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        # Hold a reference while submitting so early completions don't close fd
+        self._pending_fds[fd] = 1
+        try:
+            self.submit_write(fd, data)
+        finally:
+            self._complete(fd)
+
+    def _complete(self, fd: int):
+        """Close fd once its last pending write finished."""
+        if fd not in self._pending_fds:
+            return
+        self._pending_fds[fd] -= 1
+        if self._pending_fds[fd] == 0:
+            del self._pending_fds[fd]
+            os.close(fd)
+
+    def _reap(self, wait_nr: int):
+        """Submit queued writes and handle at least wait_nr completions."""
+        liburing.io_uring_submit(self._ring)
+        liburing.io_uring_wait_cqe_nr(self._ring, self._cqe, wait_nr)
+
+        # Peek one entry at a time: indexing past the head breaks when the CQ ring wraps
+        completions = []
+        for _ in range(liburing.io_uring_cq_ready(self._ring)):
+            liburing.io_uring_peek_cqe(self._ring, self._cqe)
+            completions.append((self._cqe[0].user_data, self._cqe[0].res))
+            liburing.io_uring_cq_advance(self._ring, 1)
+
+        retries = []
+        for user_data, res in completions:
+            fd, buf, offset, buf_index = self._inflight.pop(user_data)
+
+            if res < 0:
+                if self._error is None:
+                    self._error = OSError(-res, os.strerror(-res))
+            elif res < len(buf):
+                # Short write: the remainder is resubmitted before releasing the fd
+                retries.append((fd, bytes(buf[res:]), offset + res))
+                if fd in self._pending_fds:
+                    self._pending_fds[fd] += 1
+
+            if buf_index is not None:
+                self._free_buffers.append(buf_index)
+            self._complete(fd)
+
+        for fd, remainder, offset in retries:
+            self._submit(fd, remainder, offset)
+            self._complete(fd)
+
+    def flush(self):
+        """Wait for every queued write; raises the first write error, if any."""
+        while self._inflight:
+            self._reap(len(self._inflight))
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Flush outstanding writes and release the ring."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            for fd in self._pending_fds:
+                os.close(fd)
+            self._pending_fds.clear()
+            liburing.io_uring_queue_exit(self._ring)
+            self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class UringFile(io.RawIOBase):
+    """
+    Write-only raw file whose writes are queued on a UringWriter.
+
+    Wrap it in io.BufferedWriter (and io.TextIOWrapper for text) so the ring
+    sees large sequential chunks; closing the file waits for every write.
+    A writer created here registers fixed buffers, since every chunk the
+    buffered wrapper flushes spans several of them.
+    """
+
+    def __init__(self, path: str | Path, writer: Optional[UringWriter] = None):
+        super().__init__()
+        self._owns_writer = writer is None
+        try:
+            # Set up the ring first so a failure leaves no empty file behind
+            self._writer = writer or UringWriter(fixed_buffers=True)
+            try:
+                self._fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            except OSError:
+                if self._owns_writer:
+                    self._writer.close()
+                raise
+        except BaseException:
+            super().close()  # nothing to flush; keeps the finalizer out of close()
+            raise
+        self._offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        # submit_write copies b, so the caller may reuse it once we return
+        size = memoryview(b).nbytes
+        if size:
+            self._writer.submit_write(self._fd, b, self._offset)
+            self._offset += size
+        return size
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._owns_writer:
+                self._writer.close()
+            else:
+                self._writer.flush()
+        finally:
+            os.close(self._fd)
+            super().close()
+
+
+def open_text(path: str | Path, buffering: int, newline: Optional[str] = None) -> io.TextIOWrapper:
+    """Open path for UTF-8 text writing with io_uring-backed writes."""
+    raw = UringFile(path)
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=buffering),
+                            encoding='utf-8', newline=newline)
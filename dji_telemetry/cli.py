@@ -4,184 +4,561 @@ DJI Telemetry Overlay - Command Line Interface
 """
 
 import argparse
+import dataclasses
+import os
+import shutil
 import sys
+import tempfile
+import time
+import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dji_telemetry import (
     __version__,
     parse_srt,
+    parse_srt_summary,
     export,
-    process_video,
-    generate_overlay_video,
-    generate_overlay_frames,
-    add_audio,
-    get_video_info,
-    OverlayConfig,
+    TelemetryData,
+    TelemetryFrame,
+    TelemetrySummary,
 )
 
+# numpy is only needed for the SRT cache and liburing only with --async-io,
+# so both are imported where they are used to keep CLI startup light
+if TYPE_CHECKING:
+    import numpy as np
+
+
+VIDEO_EXTENSIONS = ['.MP4', '.MOV', '.AVI', '.MKV']
+
+# Video encoders selectable with --codec
+CODECS = ['libx264', 'h264_nvenc', 'hevc_nvenc']
+
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.1
+
+# Time and 5% step of the last progress output
+_progress_state = {'time': 0.0, 'step': -1}
+
+# Progress bar segments, sliced per redraw (bars up to 200 columns wide)
+_BAR_FULL = '=' * 200
+_BAR_EMPTY = '-' * 200
+
+# Bytes of an input file prefetched into the page cache before reading it
+PREFETCH_BYTES = 256 * 1024 * 1024
+
+# Bump when the parser or the cache layout changes to invalidate old caches
+SRT_CACHE_VERSION = 3
+
+
+def _fadvise(path: Path, advice: int, length: int = 0):
+    """Pass an access pattern hint for path to the kernel, ignoring any failure."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, length, advice)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _hint_sequential(path: Path):
+    """
+    Start reading an input file into the page cache ahead of its sequential read.
+
+    SEQUENTIAL advice only applies to the file descriptor it is given, so it is
+    set by the readers themselves; WILLNEED outlives this descriptor.
+    """
+    if hasattr(os, 'POSIX_FADV_WILLNEED'):
+        _fadvise(path, os.POSIX_FADV_WILLNEED, PREFETCH_BYTES)
+
+
+def _drop_cache(path: Path):
+    """Drop a write-once output file from the page cache (pages already written back)."""
+    if hasattr(os, 'POSIX_FADV_DONTNEED') and path.is_file():
+        _fadvise(path, os.POSIX_FADV_DONTNEED)
+
+
+def _srt_cache_path(srt_path: Path) -> Path:
+    """Location of the parsed-telemetry cache kept next to an SRT file."""
+    return srt_path.with_suffix('.srt.cache.npz')
+
+
+# Cache column dtype per TelemetryFrame field type
+_COLUMN_DTYPES = {int: 'int64', float: 'float64', str: 'str'}
+
+
+def _srt_cache_key(srt_path: Path) -> 'np.ndarray':
+    """Key identifying the SRT contents a cache was built from."""
+    import numpy as np
+
+    stat = srt_path.stat()
+    return np.array([SRT_CACHE_VERSION, stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+
+def _load_srt_cache(cache_path: Path, key: 'np.ndarray'):
+    """Load telemetry from a columnar cache, or None if missing or stale."""
+    import numpy as np
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            if not np.array_equal(cache['arr_0'], key):
+                return None
+            columns = [cache[f.name].tolist() for f in dataclasses.fields(TelemetryFrame)]
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+    return [TelemetryFrame(*values) for values in zip(*columns)]
+
+
+def _summary_columns(columns: dict) -> dict:
+    """Flight statistics reduced from the telemetry columns, as 0-d arrays."""
+    import numpy as np
+
+    if len(columns['frame_num']) == 0:
+        summary = TelemetrySummary()
+        return {
+            'frame_count': np.int64(0),
+            'duration_seconds': np.float64(summary.duration_seconds),
+            'total_distance': np.float64(summary.total_distance),
+            'max_altitude': np.float64(summary.max_altitude),
+            'max_speed': np.float64(summary.max_speed),
+            'start_coordinates': np.array(summary.start_coordinates),
+            'end_coordinates': np.array(summary.end_coordinates),
+        }
+
+    lat, lon = columns['latitude'], columns['longitude']
+    return {
+        'frame_count': np.int64(len(columns['frame_num'])),
+        'duration_seconds': np.float64(columns['end_time_ms'][-1] / 1000.0),
+        'total_distance': np.float64(columns['distance'][-1]),
+        'max_altitude': np.float64(columns['rel_alt'].max()),
+        'max_speed': np.float64(columns['h_speed'].max()),
+        'start_coordinates': np.array([lat[0], lon[0]], dtype=np.float64),
+        'end_coordinates': np.array([lat[-1], lon[-1]], dtype=np.float64),
+    }
+
+
+def _save_srt_cache(cache_path: Path, key: 'np.ndarray', telemetry: TelemetryData):
+    """
+    Write telemetry as one array per TelemetryFrame field (best effort).
+
+    The flight statistics are stored alongside as scalar entries so the info
+    command can read them without loading any per-frame column.
+    """
+    import numpy as np
+
+    # Each column takes its TelemetryFrame field type, which parse_srt produces
+    columns = {
+        f.name: np.array([getattr(frame, f.name) for frame in telemetry.frames],
+                         dtype=_COLUMN_DTYPES[f.type])
+        for f in dataclasses.fields(TelemetryFrame)
+    }
+
+    try:
+        # Unique per run, so concurrent runs on the same SRT never write the same temp file
+        fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name + '.',
+                                         suffix='.tmp')
+    except OSError:
+        # Read-only directories etc. just mean no cache
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, key, **columns, **_summary_columns(columns))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def _load_srt_summary(cache_path: Path, key: 'np.ndarray'):
+    """Load only the flight statistics from a cache, or None if missing or stale."""
+    import numpy as np
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            if not np.array_equal(cache['arr_0'], key):
+                return None
+            return TelemetrySummary(
+                frame_count=int(cache['frame_count']),
+                duration_seconds=float(cache['duration_seconds']),
+                total_distance=float(cache['total_distance']),
+                max_altitude=float(cache['max_altitude']),
+                max_speed=float(cache['max_speed']),
+                start_coordinates=tuple(cache['start_coordinates'].tolist()),
+                end_coordinates=tuple(cache['end_coordinates'].tolist()),
+            )
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def _cached_parse_srt(srt_path: Path) -> TelemetryData:
+    """
+    Parse an SRT file, reusing the columnar cache next to it when up to date.
+
+    The cache is keyed by the SRT's mtime and size, so editing or replacing the
+    file triggers a fresh parse.
+    """
+    key = _srt_cache_key(srt_path)
+    cache_path = _srt_cache_path(srt_path)
+
+    frames = _load_srt_cache(cache_path, key)
+    if frames is not None:
+        return TelemetryData(frames=frames, source_file=str(srt_path))
+
+    _hint_sequential(srt_path)
+    telemetry = parse_srt(srt_path)
+    _save_srt_cache(cache_path, key, telemetry)
+    return telemetry
+
+
+def _cached_srt_summary(srt_path: Path) -> TelemetrySummary:
+    """
+    Flight statistics for an SRT file, read from its cache when up to date.
+
+    Without a valid cache the file is only streamed for its statistics;
+    no cache is written, since that would need the full parse.
+    """
+    summary = _load_srt_summary(_srt_cache_path(srt_path), _srt_cache_key(srt_path))
+    if summary is not None:
+        return summary
+
+    _hint_sequential(srt_path)
+    return parse_srt_summary(srt_path)
+
 
 def progress_bar(current: int, total: int, width: int = 50):
-    """Display a progress bar."""
+    """
+    Display a progress bar.
+
+    Redraws are throttled to one per PROGRESS_INTERVAL seconds and only the
+    final update flushes stdout. When stdout is not a terminal, one line is
+    printed per 5% step instead of animating with carriage returns.
+    """
+    done = current == total
+    now = time.monotonic()
+    if not done and now - _progress_state['time'] < PROGRESS_INTERVAL:
+        return
+    _progress_state['time'] = now
+
     percent = current / total
+
+    if not sys.stdout.isatty():
+        step = int(percent * 20)
+        if step != _progress_state['step']:
+            _progress_state['step'] = step
+            print(f'{percent*100:.1f}% ({current}/{total})', flush=done)
+        return
+
     filled = int(width * percent)
-    bar = '=' * filled + '-' * (width - filled)
-    sys.stdout.write(f'\r[{bar}] {percent*100:.1f}% ({current}/{total})')
-    sys.stdout.flush()
-    if current == total:
-        print()
+    bar = _BAR_FULL[:filled] + _BAR_EMPTY[:width - filled]
+    sys.stdout.write(f'\r[{bar}] {percent*100:.1f}% ({current}/{total})' + ('\n' if done else ''))
+    if done:
+        sys.stdout.flush()
 
 
-def cmd_overlay(args):
-    """Process video with telemetry overlay."""
-    video_path = Path(args.video)
-    srt_path = Path(args.srt) if args.srt else video_path.with_suffix('.SRT')
+def _async_io_enabled(args) -> bool:
+    """Whether --async-io was requested and io_uring can be used here."""
+    if not args.async_io:
+        return False
 
-    if not video_path.exists():
-        print(f"Error: Video file not found: {video_path}")
+    from dji_telemetry import _uring
+
+    if not _uring.available():
+        print("Warning: --async-io needs Linux, liburing and a kernel that allows io_uring, "
+              "using regular I/O")
+        return False
+    return True
+
+
+def _config_from_args(args):
+    """Build the OverlayConfig for the shared overlay display options."""
+    from dji_telemetry import OverlayConfig
+
+    return OverlayConfig(
+        show_altitude=not args.no_altitude,
+        show_speed=not args.no_speed,
+        show_vertical_speed=not args.no_vspeed,
+        show_coordinates=not args.no_coords,
+        show_camera_settings=not args.no_camera,
+        show_timestamp=not args.no_timestamp,
+        show_speed_gauge=not args.no_gauge,
+        gauge_max_speed_kmh=getattr(args, 'gauge_max', 50.0),
+    )
+
+
+def _codec_from_args(args) -> str:
+    """The requested --codec, or libx264 with a warning when ffmpeg lacks it."""
+    from dji_telemetry import has_encoder
+
+    if args.codec != 'libx264' and not has_encoder(args.codec):
+        print(f"Warning: ffmpeg has no {args.codec} encoder, using libx264")
+        return 'libx264'
+    return args.codec
+
+
+def _encode_overlay_pipe(telemetry, output_path, args, config, labels, pix_fmt, codec='libx264') -> int:
+    """
+    Render overlay frames straight into an ffmpeg encoder.
+
+    Raises FileNotFoundError if ffmpeg is not installed; returns the exit code.
+    """
+    from dji_telemetry import generate_overlay_frames, open_ffmpeg_writer
+
+    try:
+        proc = open_ffmpeg_writer(output_path, args.width, args.height, args.fps,
+                                  codec=codec, pix_fmt=pix_fmt)
+    except ValueError as e:
+        print(f"Error: {e}")
         return 1
 
-    if not srt_path.exists():
-        print(f"Error: SRT file not found: {srt_path}")
+    try:
+        generate_overlay_frames(
+            telemetry, output_path,
+            width=args.width, height=args.height, fps=args.fps,
+            config=config,
+            progress_callback=progress_bar if not args.quiet else None,
+            sink=proc.stdin,
+            labels=labels,
+            pix_fmt=pix_fmt
+        )
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its status is reported below
+        proc.wait()
+
+    if proc.returncode != 0:
+        print(f"\nError: ffmpeg exited with status {proc.returncode}")
         return 1
 
+    _drop_cache(output_path)
+    print(f"\nOutput saved to: {output_path}")
+    return 0
+
+
+def cmd_overlay(args):
+    """Process video with telemetry overlay."""
+    from dji_telemetry import get_video_info, precompute_labels, process_video, process_video_ffmpeg
+
+    video_path = Path(args.video)
+    srt_path = Path(args.srt) if args.srt else video_path.with_suffix('.SRT')
+
     output_path = Path(args.output) if args.output else video_path.with_name(
         video_path.stem + '_telemetry.mp4'
     )
 
+    # Open the video before parsing, so a missing video is reported ahead of the SRT
+    try:
+        info = get_video_info(video_path)
+    except FileNotFoundError:
+        print(f"Error: Video file not found: {video_path}")
+        return 1
+    except IOError as e:
+        print(f"Error: {e}")
+        return 1
+
     print(f"Parsing telemetry: {srt_path}")
-    telemetry = parse_srt(srt_path)
+    try:
+        telemetry = _cached_parse_srt(srt_path)
+    except FileNotFoundError:
+        print(f"Error: SRT file not found: {srt_path}")
+        return 1
     print(f"  Loaded {len(telemetry.frames)} frames")
     print(f"  Duration: {telemetry.duration_seconds:.1f}s")
     print(f"  Max altitude: {telemetry.max_altitude:.1f}m")
     print(f"  Max speed: {telemetry.max_speed * 3.6:.1f} km/h")
 
     # Build overlay config
-    config = OverlayConfig(
-        show_altitude=not args.no_altitude,
-        show_speed=not args.no_speed,
-        show_vertical_speed=not args.no_vspeed,
-        show_coordinates=not args.no_coords,
-        show_camera_settings=not args.no_camera,
-        show_timestamp=not args.no_timestamp,
-        show_speed_gauge=not args.no_gauge,
-        gauge_max_speed_kmh=args.gauge_max,
-    )
+    config = _config_from_args(args)
+    labels = precompute_labels(telemetry, config)
 
     print(f"\nProcessing video: {video_path}")
-    temp_output = output_path.with_name(output_path.stem + '_temp.mp4')
+    _hint_sequential(video_path)
 
-    process_video(
-        video_path, telemetry, temp_output, config,
-        progress_callback=progress_bar if not args.quiet else None
-    )
+    # Written under a temporary name so a failed run never leaves a partial output
+    temp_output = output_path.with_name(output_path.stem + '_temp' + output_path.suffix)
 
-    # Add audio if requested
-    if args.audio:
-        print(f"Adding audio from: {video_path}")
-        add_audio(temp_output, video_path, output_path)
-        temp_output.unlink()
+    # ffmpeg encodes yuv420p, which needs an even frame size; OpenCV takes any size
+    if not shutil.which('ffmpeg'):
+        fallback = "ffmpeg not found"
+    elif info['width'] % 2 or info['height'] % 2:
+        fallback = f"odd video size {info['width']}x{info['height']}"
     else:
-        temp_output.rename(output_path)
+        fallback = None
+
+    try:
+        if fallback is None:
+            # Composite, encode and copy audio in a single ffmpeg pass
+            process_video_ffmpeg(
+                video_path, telemetry, temp_output, config,
+                audio=args.audio,
+                progress_callback=progress_bar if not args.quiet else None,
+                sample_fps=args.sample_fps,
+                labels=labels,
+                reuse_overlays=not args.no_overlay_cache,
+                pix_fmt=args.pix_fmt,
+                codec=_codec_from_args(args)
+            )
+        else:
+            if args.audio:
+                print(f"Warning: {fallback}, output will have no audio")
+            if args.codec != 'libx264':
+                print(f"Warning: {fallback}, {args.codec} is not available")
+
+            process_video(
+                video_path, telemetry, temp_output, config,
+                progress_callback=progress_bar if not args.quiet else None,
+                sample_fps=args.sample_fps,
+                labels=labels
+            )
+        os.replace(temp_output, output_path)
+    except FileNotFoundError:
+        print(f"Error: Video file not found: {video_path}")
+        return 1
+    except IOError as e:
+        print(f"\nError: {e}")
+        return 1
+    finally:
+        # Only still there if the run failed or was interrupted
+        temp_output.unlink(missing_ok=True)
 
+    _drop_cache(output_path)
     print(f"\nOutput saved to: {output_path}")
     return 0
 
 
 def cmd_overlay_only(args):
     """Generate transparent overlay video."""
-    srt_path = Path(args.srt)
+    from dji_telemetry import generate_overlay_video, precompute_labels
 
-    if not srt_path.exists():
-        print(f"Error: SRT file not found: {srt_path}")
-        return 1
+    srt_path = Path(args.srt)
 
     output_path = Path(args.output) if args.output else srt_path.with_name(
         srt_path.stem + '_overlay.mp4'
     )
 
     print(f"Parsing telemetry: {srt_path}")
-    telemetry = parse_srt(srt_path)
+    try:
+        telemetry = _cached_parse_srt(srt_path)
+    except FileNotFoundError:
+        print(f"Error: SRT file not found: {srt_path}")
+        return 1
     print(f"  Loaded {len(telemetry.frames)} frames")
 
-    config = OverlayConfig(
-        show_altitude=not args.no_altitude,
-        show_speed=not args.no_speed,
-        show_vertical_speed=not args.no_vspeed,
-        show_coordinates=not args.no_coords,
-        show_camera_settings=not args.no_camera,
-        show_timestamp=not args.no_timestamp,
-        show_speed_gauge=not args.no_gauge,
-        gauge_max_speed_kmh=args.gauge_max,
-    )
+    config = _config_from_args(args)
+    labels = precompute_labels(telemetry, config)
 
     print(f"\nGenerating overlay video: {args.width}x{args.height} @ {args.fps}fps")
+
+    # .mov/.webm keep their OpenCV codecs; anything else is encoded by ffmpeg when present
+    if not shutil.which('ffmpeg'):
+        fallback = "ffmpeg not found"
+    elif output_path.suffix.lower() in ('.mov', '.webm'):
+        fallback = f"{output_path.suffix} output uses its OpenCV codec"
+    else:
+        return _encode_overlay_pipe(telemetry, output_path, args, config, labels,
+                                    'yuv420p', codec=_codec_from_args(args))
+
+    if args.codec != 'libx264':
+        print(f"Warning: {fallback}, {args.codec} is not available")
+
     generate_overlay_video(
         telemetry, output_path,
         width=args.width, height=args.height, fps=args.fps,
         config=config,
-        progress_callback=progress_bar if not args.quiet else None
+        progress_callback=progress_bar if not args.quiet else None,
+        labels=labels
     )
 
+    _drop_cache(output_path)
     print(f"\nOutput saved to: {output_path}")
     return 0
 
 
 def cmd_frames(args):
     """Generate transparent overlay frames."""
+    from dji_telemetry import generate_overlay_frames, precompute_labels
+
     srt_path = Path(args.srt)
 
-    if not srt_path.exists():
-        print(f"Error: SRT file not found: {srt_path}")
-        return 1
+    # Stream straight into ffmpeg when a video is wanted instead of images
+    pipe = args.pipe or (args.output is not None and Path(args.output).suffix.upper() in VIDEO_EXTENSIONS)
 
-    output_dir = Path(args.output) if args.output else srt_path.with_name(
-        srt_path.stem + '_frames'
-    )
+    if pipe:
+        output_path = Path(args.output) if args.output else srt_path.with_name(
+            srt_path.stem + '_frames.mp4'
+        )
+    else:
+        output_path = Path(args.output) if args.output else srt_path.with_name(
+            srt_path.stem + '_frames'
+        )
 
     print(f"Parsing telemetry: {srt_path}")
-    telemetry = parse_srt(srt_path)
+    try:
+        telemetry = _cached_parse_srt(srt_path)
+    except FileNotFoundError:
+        print(f"Error: SRT file not found: {srt_path}")
+        return 1
     print(f"  Loaded {len(telemetry.frames)} frames")
 
-    config = OverlayConfig(
-        show_altitude=not args.no_altitude,
-        show_speed=not args.no_speed,
-        show_vertical_speed=not args.no_vspeed,
-        show_coordinates=not args.no_coords,
-        show_camera_settings=not args.no_camera,
-        show_timestamp=not args.no_timestamp,
-        show_speed_gauge=not args.no_gauge,
-    )
-
-    print(f"\nGenerating frames: {args.width}x{args.height} @ {args.fps}fps")
-    generate_overlay_frames(
-        telemetry, output_dir,
-        width=args.width, height=args.height, fps=args.fps,
-        config=config, format=args.format,
-        progress_callback=progress_bar if not args.quiet else None
-    )
-
-    print(f"\nFrames saved to: {output_dir}")
-    return 0
+    config = _config_from_args(args)
+    labels = precompute_labels(telemetry, config)
+
+    if not pipe:
+        print(f"\nGenerating frames: {args.width}x{args.height} @ {args.fps}fps")
+        generate_overlay_frames(
+            telemetry, output_path,
+            width=args.width, height=args.height, fps=args.fps,
+            config=config, format=args.format,
+            progress_callback=progress_bar if not args.quiet else None,
+            jobs=args.jobs,
+            async_io=_async_io_enabled(args),
+            labels=labels
+        )
+
+        print(f"\nFrames saved to: {output_path}")
+        return 0
+
+    print(f"\nPiping frames to ffmpeg: {args.width}x{args.height} @ {args.fps}fps")
+    try:
+        return _encode_overlay_pipe(telemetry, output_path, args, config, labels, args.pix_fmt)
+    except FileNotFoundError:
+        print("Error: ffmpeg not found (required for --pipe)")
+        return 1
 
 
 def cmd_export(args):
     """Export telemetry data to CSV, JSON, or GPX."""
     srt_path = Path(args.srt)
 
-    if not srt_path.exists():
-        print(f"Error: SRT file not found: {srt_path}")
-        return 1
-
     output_path = Path(args.output)
 
     print(f"Parsing telemetry: {srt_path}")
-    telemetry = parse_srt(srt_path)
+    try:
+        telemetry = _cached_parse_srt(srt_path)
+    except FileNotFoundError:
+        print(f"Error: SRT file not found: {srt_path}")
+        return 1
     print(f"  Loaded {len(telemetry.frames)} frames")
     print(f"  Duration: {telemetry.duration_seconds:.1f}s")
     print(f"  Distance: {telemetry.total_distance:.1f}m")
 
     print(f"\nExporting to: {output_path}")
-    export(telemetry, output_path, format=args.format)
+    export(telemetry, output_path, format=args.format, async_io=_async_io_enabled(args))
+    _drop_cache(output_path)
 
     print("Done!")
     return 0
@@ -191,26 +568,34 @@ def cmd_info(args):
     """Show information about video and SRT files."""
     path = Path(args.path)
 
-    if not path.exists():
-        print(f"Error: File not found: {path}")
-        return 1
-
     if path.suffix.upper() == '.SRT':
+        try:
+            summary = _cached_srt_summary(path)
+        except FileNotFoundError:
+            print(f"Error: File not found: {path}")
+            return 1
+
         print(f"SRT File: {path}")
         print("-" * 50)
-        telemetry = parse_srt(path)
-        print(f"Frames:        {len(telemetry.frames)}")
-        print(f"Duration:      {telemetry.duration_seconds:.1f}s")
-        print(f"Distance:      {telemetry.total_distance:.1f}m")
-        print(f"Max altitude:  {telemetry.max_altitude:.1f}m")
-        print(f"Max speed:     {telemetry.max_speed * 3.6:.1f} km/h")
-        print(f"Start coords:  {telemetry.start_coordinates[0]:.6f}, {telemetry.start_coordinates[1]:.6f}")
-        print(f"End coords:    {telemetry.end_coordinates[0]:.6f}, {telemetry.end_coordinates[1]:.6f}")
-
-    elif path.suffix.upper() in ['.MP4', '.MOV', '.AVI', '.MKV']:
+        print(f"Frames:        {summary.frame_count}")
+        print(f"Duration:      {summary.duration_seconds:.1f}s")
+        print(f"Distance:      {summary.total_distance:.1f}m")
+        print(f"Max altitude:  {summary.max_altitude:.1f}m")
+        print(f"Max speed:     {summary.max_speed * 3.6:.1f} km/h")
+        print(f"Start coords:  {summary.start_coordinates[0]:.6f}, {summary.start_coordinates[1]:.6f}")
+        print(f"End coords:    {summary.end_coordinates[0]:.6f}, {summary.end_coordinates[1]:.6f}")
+
+    elif path.suffix.upper() in VIDEO_EXTENSIONS:
+        from dji_telemetry import get_video_info
+
+        try:
+            info = get_video_info(path)
+        except FileNotFoundError:
+            print(f"Error: File not found: {path}")
+            return 1
+
         print(f"Video File: {path}")
         print("-" * 50)
-        info = get_video_info(path)
         print(f"Resolution:    {info['width']}x{info['height']}")
         print(f"FPS:           {info['fps']:.2f}")
         print(f"Frames:        {info['frame_count']}")
@@ -248,60 +633,70 @@ Examples:
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
+    # Options shared by every command that renders the overlay
+    overlay_opts = argparse.ArgumentParser(add_help=False)
+    overlay_opts.add_argument('--quiet', '-q', action='store_true', help='Suppress progress output')
+    overlay_display = overlay_opts.add_argument_group('overlay options')
+    overlay_display.add_argument('--no-altitude', action='store_true', help='Hide altitude')
+    overlay_display.add_argument('--no-speed', action='store_true', help='Hide horizontal speed')
+    overlay_display.add_argument('--no-vspeed', action='store_true', help='Hide vertical speed')
+    overlay_display.add_argument('--no-coords', action='store_true', help='Hide GPS coordinates')
+    overlay_display.add_argument('--no-camera', action='store_true', help='Hide camera settings')
+    overlay_display.add_argument('--no-timestamp', action='store_true', help='Hide timestamp')
+    overlay_display.add_argument('--no-gauge', action='store_true', help='Hide speed gauge')
+
     # === overlay command ===
-    p_overlay = subparsers.add_parser('overlay', help='Process video with telemetry overlay')
+    p_overlay = subparsers.add_parser('overlay', parents=[overlay_opts],
+                                      help='Process video with telemetry overlay')
     p_overlay.add_argument('video', help='Input video file (MP4)')
     p_overlay.add_argument('--srt', '-s', help='SRT telemetry file (default: same name as video)')
     p_overlay.add_argument('--output', '-o', help='Output video file')
     p_overlay.add_argument('--audio', '-a', action='store_true', help='Copy audio from original video')
-    p_overlay.add_argument('--quiet', '-q', action='store_true', help='Suppress progress output')
-    # Overlay options
-    p_overlay.add_argument('--no-altitude', action='store_true', help='Hide altitude')
-    p_overlay.add_argument('--no-speed', action='store_true', help='Hide horizontal speed')
-    p_overlay.add_argument('--no-vspeed', action='store_true', help='Hide vertical speed')
-    p_overlay.add_argument('--no-coords', action='store_true', help='Hide GPS coordinates')
-    p_overlay.add_argument('--no-camera', action='store_true', help='Hide camera settings')
-    p_overlay.add_argument('--no-timestamp', action='store_true', help='Hide timestamp')
-    p_overlay.add_argument('--no-gauge', action='store_true', help='Hide speed gauge')
+    p_overlay.add_argument('--sample-fps', type=float,
+                           help='Output frame rate; extra source frames are still decoded but '
+                                'dropped before the overlay is rendered and encoded')
     p_overlay.add_argument('--gauge-max', type=float, default=50.0, help='Speed gauge max (km/h, default: 50)')
+    p_overlay.add_argument('--no-overlay-cache', action='store_true',
+                           help='Render the overlay for every video frame instead of once per telemetry frame')
+    p_overlay.add_argument('--codec', choices=CODECS, default='libx264',
+                           help='Video encoder; the NVENC encoders use an NVIDIA GPU (default: libx264)')
+    p_overlay.add_argument('--pix-fmt', choices=['yuva420p', 'bgra'], default='yuva420p',
+                           help='Pixel format of overlay frames piped to ffmpeg (default: yuva420p)')
     p_overlay.set_defaults(func=cmd_overlay)
 
     # === overlay-only command ===
-    p_overlay_only = subparsers.add_parser('overlay-only', help='Generate transparent overlay video')
+    p_overlay_only = subparsers.add_parser('overlay-only', parents=[overlay_opts],
+                                           help='Generate transparent overlay video')
     p_overlay_only.add_argument('srt', help='SRT telemetry file')
     p_overlay_only.add_argument('--output', '-o', help='Output video file')
     p_overlay_only.add_argument('--width', '-W', type=int, default=1920, help='Video width (default: 1920)')
     p_overlay_only.add_argument('--height', '-H', type=int, default=1080, help='Video height (default: 1080)')
     p_overlay_only.add_argument('--fps', type=float, default=30.0, help='Frames per second (default: 30)')
-    p_overlay_only.add_argument('--quiet', '-q', action='store_true', help='Suppress progress output')
-    # Overlay options
-    p_overlay_only.add_argument('--no-altitude', action='store_true', help='Hide altitude')
-    p_overlay_only.add_argument('--no-speed', action='store_true', help='Hide horizontal speed')
-    p_overlay_only.add_argument('--no-vspeed', action='store_true', help='Hide vertical speed')
-    p_overlay_only.add_argument('--no-coords', action='store_true', help='Hide GPS coordinates')
-    p_overlay_only.add_argument('--no-camera', action='store_true', help='Hide camera settings')
-    p_overlay_only.add_argument('--no-timestamp', action='store_true', help='Hide timestamp')
-    p_overlay_only.add_argument('--no-gauge', action='store_true', help='Hide speed gauge')
     p_overlay_only.add_argument('--gauge-max', type=float, default=50.0, help='Speed gauge max (km/h)')
+    p_overlay_only.add_argument('--codec', choices=CODECS, default='libx264',
+                                help='Video encoder used through ffmpeg; the NVENC encoders use an '
+                                     'NVIDIA GPU (default: libx264)')
     p_overlay_only.set_defaults(func=cmd_overlay_only)
 
     # === frames command ===
-    p_frames = subparsers.add_parser('frames', help='Generate transparent overlay frames (PNG sequence)')
+    p_frames = subparsers.add_parser('frames', parents=[overlay_opts],
+                                     help='Generate transparent overlay frames (PNG sequence)')
     p_frames.add_argument('srt', help='SRT telemetry file')
-    p_frames.add_argument('--output', '-o', help='Output directory')
+    p_frames.add_argument('--output', '-o', help='Output directory (or video file with --pipe)')
     p_frames.add_argument('--width', '-W', type=int, default=1920, help='Frame width (default: 1920)')
     p_frames.add_argument('--height', '-H', type=int, default=1080, help='Frame height (default: 1080)')
     p_frames.add_argument('--fps', type=float, default=30.0, help='Frames per second (default: 30)')
+    p_frames.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                          help='Worker processes rendering image files (default: CPU count; '
+                               '--pipe always renders in-process)')
     p_frames.add_argument('--format', '-f', default='png', choices=['png', 'jpg'], help='Image format')
-    p_frames.add_argument('--quiet', '-q', action='store_true', help='Suppress progress output')
-    # Overlay options
-    p_frames.add_argument('--no-altitude', action='store_true', help='Hide altitude')
-    p_frames.add_argument('--no-speed', action='store_true', help='Hide horizontal speed')
-    p_frames.add_argument('--no-vspeed', action='store_true', help='Hide vertical speed')
-    p_frames.add_argument('--no-coords', action='store_true', help='Hide GPS coordinates')
-    p_frames.add_argument('--no-camera', action='store_true', help='Hide camera settings')
-    p_frames.add_argument('--no-timestamp', action='store_true', help='Hide timestamp')
-    p_frames.add_argument('--no-gauge', action='store_true', help='Hide speed gauge')
+    p_frames.add_argument('--pipe', '-p', action='store_true',
+                          help='Encode frames to a video via ffmpeg instead of writing images '
+                               '(default when output has a video extension)')
+    p_frames.add_argument('--pix-fmt', choices=['yuv420p', 'bgra'], default='yuv420p',
+                          help='Pixel format of frames piped to ffmpeg with --pipe (default: yuv420p)')
+    p_frames.add_argument('--async-io', action='store_true',
+                          help='Batch image file writes through io_uring (Linux, requires liburing)')
     p_frames.set_defaults(func=cmd_frames)
 
     # === export command ===
@@ -309,6 +704,8 @@ Examples:
     p_export.add_argument('srt', help='SRT telemetry file')
     p_export.add_argument('--output', '-o', required=True, help='Output file (extension determines format)')
     p_export.add_argument('--format', '-f', choices=['csv', 'json', 'gpx'], help='Output format (auto-detected from extension)')
+    p_export.add_argument('--async-io', action='store_true',
+                          help='Write the output file through io_uring (Linux, requires liburing)')
     p_export.set_defaults(func=cmd_export)
 
     # === info command ===
@@ -7,13 +7,33 @@ import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from xml.etree import ElementTree as ET
-from xml.dom import minidom
 
-from .parser import TelemetryData
+from .parser import TelemetryData, TelemetryFrame
 
 
-def to_csv(data: TelemetryData, output_path: str | Path, include_all_fields: bool = True) -> Path:
+# Output buffer size, so large exports reach the OS in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+GPX_NAMESPACE = 'http://www.topografix.com/GPX/1/1'
+XSI_NAMESPACE = 'http://www.w3.org/2001/XMLSchema-instance'
+
+
+def _open_output(output_path: Path, newline: Optional[str] = None, async_io: bool = False):
+    """Open an export file for buffered UTF-8 text writing."""
+    if async_io:
+        # Imported here so liburing is only loaded when io_uring writes are requested
+        from . import _uring
+
+        return _uring.open_text(output_path, WRITE_BUFFER_SIZE, newline=newline)
+    return open(output_path, 'w', newline=newline, encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+
+def to_csv(
+    data: TelemetryData,
+    output_path: str | Path,
+    include_all_fields: bool = True,
+    async_io: bool = False
+) -> Path:
     """
     Export telemetry data to CSV format.
 
@@ -21,6 +41,7 @@ def to_csv(data: TelemetryData, output_path: str | Path, include_all_fields: boo
         data: TelemetryData object
         output_path: Output file path
         include_all_fields: Include all fields or just essential ones
+        async_io: Write through io_uring (Linux with liburing installed)
 
     Returns:
         Path to the created file
@@ -40,16 +61,20 @@ def to_csv(data: TelemetryData, output_path: str | Path, include_all_fields: boo
             'h_speed_kmh', 'v_speed_ms'
         ]
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    with _open_output(output_path, newline='', async_io=async_io) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
         writer.writeheader()
-        for frame in data.frames:
-            writer.writerow(frame.to_dict())
+        writer.writerows(frame.to_dict() for frame in data.frames)
 
     return output_path
 
 
-def to_json(data: TelemetryData, output_path: str | Path, indent: int = 2) -> Path:
+def to_json(
+    data: TelemetryData,
+    output_path: str | Path,
+    indent: int = 2,
+    async_io: bool = False
+) -> Path:
     """
     Export telemetry data to JSON format.
 
@@ -57,6 +82,7 @@ def to_json(data: TelemetryData, output_path: str | Path, indent: int = 2) -> Pa
         data: TelemetryData object
         output_path: Output file path
         indent: JSON indentation level (None for compact)
+        async_io: Write through io_uring (Linux with liburing installed)
 
     Returns:
         Path to the created file
@@ -83,8 +109,9 @@ def to_json(data: TelemetryData, output_path: str | Path, indent: int = 2) -> Pa
         'frames': data.to_list()
     }
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=indent)
+    # Encoding to one string avoids json.dump's many small chunked writes
+    with _open_output(output_path, async_io=async_io) as f:
+        f.write(json.dumps(output, indent=indent))
 
     return output_path
 
@@ -93,7 +120,8 @@ def to_gpx(
     data: TelemetryData,
     output_path: str | Path,
     name: Optional[str] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    async_io: bool = False
 ) -> Path:
     """
     Export telemetry data to GPX format.
@@ -103,86 +131,97 @@ def to_gpx(
         output_path: Output file path
         name: Track name (defaults to source filename)
         description: Track description
+        async_io: Write through io_uring (Linux with liburing installed)
 
     Returns:
         Path to the created file
     """
     output_path = Path(output_path)
 
-    # Create GPX root element
-    gpx = ET.Element('gpx')
-    gpx.set('version', '1.1')
-    gpx.set('creator', 'dji-telemetry-overlay')
-    gpx.set('xmlns', 'http://www.topografix.com/GPX/1/1')
-    gpx.set('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')
-    gpx.set('xsi:schemaLocation', 'http://www.topografix.com/GPX/1/1 http://www.topografix.com/GPX/1/1/gpx.xsd')
+    lines = [
+        '<?xml version="1.0" ?>',
+        f'<gpx xmlns="{GPX_NAMESPACE}" xmlns:xsi="{XSI_NAMESPACE}" version="1.1" '
+        f'creator="dji-telemetry-overlay" xsi:schemaLocation="{GPX_NAMESPACE} {GPX_NAMESPACE}/gpx.xsd">',
+    ]
 
     # Metadata
-    metadata = ET.SubElement(gpx, 'metadata')
+    metadata = []
     if name or data.source_file:
-        name_elem = ET.SubElement(metadata, 'name')
-        name_elem.text = name or Path(data.source_file).stem if data.source_file else 'DJI Flight'
+        metadata.append(_xml_element('    ', 'name',
+                                     name or Path(data.source_file).stem if data.source_file else 'DJI Flight'))
     if description:
-        desc_elem = ET.SubElement(metadata, 'desc')
-        desc_elem.text = description
+        metadata.append(_xml_element('    ', 'desc', description))
+    if metadata:
+        lines += ['  <metadata>', *metadata, '  </metadata>']
+    else:
+        lines.append('  <metadata/>')
 
     # Create track
-    trk = ET.SubElement(gpx, 'trk')
-
-    trk_name = ET.SubElement(trk, 'name')
-    trk_name.text = name or (Path(data.source_file).stem if data.source_file else 'DJI Flight')
-
-    # Track segment
-    trkseg = ET.SubElement(trk, 'trkseg')
-
-    # Add track points
-    for frame in data.frames:
-        trkpt = ET.SubElement(trkseg, 'trkpt')
-        trkpt.set('lat', f'{frame.latitude:.6f}')
-        trkpt.set('lon', f'{frame.longitude:.6f}')
-
-        # Elevation (using absolute altitude for GPX)
-        ele = ET.SubElement(trkpt, 'ele')
-        ele.text = f'{frame.abs_alt:.1f}'
-
-        # Time
-        if frame.timestamp:
-            time_elem = ET.SubElement(trkpt, 'time')
-            try:
-                # Parse timestamp and convert to ISO format
-                dt = datetime.strptime(frame.timestamp, '%Y-%m-%d %H:%M:%S.%f')
-                time_elem.text = dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-            except ValueError:
-                pass
-
-        # Extensions for speed data
-        extensions = ET.SubElement(trkpt, 'extensions')
-
-        speed = ET.SubElement(extensions, 'speed')
-        speed.text = f'{frame.h_speed:.2f}'
+    lines.append('  <trk>')
+    lines.append(_xml_element('    ', 'name',
+                              name or (Path(data.source_file).stem if data.source_file else 'DJI Flight')))
+
+    # Track segment with one block of lines per track point
+    if data.frames:
+        lines.append('    <trkseg>')
+        lines.extend(_gpx_trkpt(frame) for frame in data.frames)
+        lines.append('    </trkseg>')
+    else:
+        lines.append('    <trkseg/>')
 
-        vspeed = ET.SubElement(extensions, 'vspeed')
-        vspeed.text = f'{frame.v_speed:.2f}'
+    lines += ['  </trk>', '</gpx>']
 
-    # Pretty print
-    xml_str = ET.tostring(gpx, encoding='unicode')
-    dom = minidom.parseString(xml_str)
-    pretty_xml = dom.toprettyxml(indent='  ')
+    with _open_output(output_path, async_io=async_io) as f:
+        f.write('\n'.join(lines))
 
-    # Remove extra blank lines
-    lines = [line for line in pretty_xml.split('\n') if line.strip()]
-    pretty_xml = '\n'.join(lines)
+    return output_path
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(pretty_xml)
 
-    return output_path
+def _xml_escape(value: str) -> str:
+    """Escape text for XML element content."""
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+
+
+def _xml_element(indent: str, tag: str, text: Optional[str]) -> str:
+    """Format a text-only element on a single line."""
+    if not text:
+        return f'{indent}<{tag}/>'
+    return f'{indent}<{tag}>{_xml_escape(text)}</{tag}>'
+
+
+def _gpx_trkpt(frame: TelemetryFrame) -> str:
+    """Format a telemetry frame as a GPX track point."""
+    time_text = None
+    if frame.timestamp:
+        try:
+            # Parse timestamp and convert to ISO format
+            dt = datetime.strptime(frame.timestamp, '%Y-%m-%d %H:%M:%S.%f')
+            time_text = dt.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+        except ValueError:
+            pass
+
+    # Elevation uses absolute altitude for GPX; speeds go in extensions
+    parts = [
+        f'      <trkpt lat="{frame.latitude:.6f}" lon="{frame.longitude:.6f}">',
+        f'        <ele>{frame.abs_alt:.1f}</ele>',
+    ]
+    if frame.timestamp:
+        parts.append(_xml_element('        ', 'time', time_text))
+    parts += [
+        '        <extensions>',
+        f'          <speed>{frame.h_speed:.2f}</speed>',
+        f'          <vspeed>{frame.v_speed:.2f}</vspeed>',
+        '        </extensions>',
+        '      </trkpt>',
+    ]
+    return '\n'.join(parts)
 
 
 def export(
     data: TelemetryData,
     output_path: str | Path,
-    format: Optional[str] = None
+    format: Optional[str] = None,
+    async_io: bool = False
 ) -> Path:
     """
     Export telemetry data to specified format (auto-detected from extension if not specified).
@@ -191,6 +230,7 @@ def export(
         data: TelemetryData object
         output_path: Output file path
         format: Output format ('csv', 'json', 'gpx') - auto-detected if None
+        async_io: Write through io_uring (Linux with liburing installed)
 
     Returns:
         Path to the created file
@@ -201,10 +241,10 @@ def export(
         format = output_path.suffix.lower().lstrip('.')
 
     if format == 'csv':
-        return to_csv(data, output_path)
+        return to_csv(data, output_path, async_io=async_io)
     elif format == 'json':
-        return to_json(data, output_path)
+        return to_json(data, output_path, async_io=async_io)
     elif format == 'gpx':
-        return to_gpx(data, output_path)
+        return to_gpx(data, output_path, async_io=async_io)
     else:
         raise ValueError(f"Unsupported format: {format}. Use 'csv', 'json', or 'gpx'.")
@@ -9,7 +9,21 @@ from typing import Optional
 import cv2
 import numpy as np
 
-from .parser import TelemetryFrame
+from .parser import TelemetryData, TelemetryFrame
+
+
+# Text of each overlay label, shared by per-frame rendering and precompute_labels
+LABEL_FORMATS = {
+    'altitude': 'ALT: %.1fm',
+    'h_speed': 'H.SPD: %.1f km/h',
+    'v_speed': 'V.SPD: %+.1f m/s',
+    'iso': 'ISO %d',
+    'shutter': '%ss',
+    'fnum': 'f/%s',
+    'ev': 'EV %+.1f',
+    'coordinates': '%.6f%s  %.6f%s',
+    'gauge_speed': '%.0f',
+}
 
 
 @dataclass
@@ -40,6 +54,83 @@ class OverlayConfig:
     padding_factor: float = 0.015  # Padding as fraction of height
 
 
+def _coordinates_label(latitude: float, longitude: float) -> str:
+    """Format coordinates as unsigned degrees with N/S and E/W suffixes."""
+    return LABEL_FORMATS['coordinates'] % (abs(latitude), "S" if latitude < 0 else "N",
+                                           abs(longitude), "W" if longitude < 0 else "E")
+
+
+def _timestamp_label(timestamp: str) -> str:
+    """Reduce an SRT timestamp to HH:MM:SS."""
+    return timestamp.split(' ')[-1].split('.')[0] if timestamp else ""
+
+
+def _frame_labels(frame: TelemetryFrame, config: OverlayConfig) -> dict[str, str]:
+    """Format the labels shown by config for a single telemetry frame."""
+    labels = {}
+    if config.show_altitude:
+        labels['altitude'] = LABEL_FORMATS['altitude'] % frame.rel_alt
+    if config.show_speed:
+        labels['h_speed'] = LABEL_FORMATS['h_speed'] % (frame.h_speed * 3.6)
+    if config.show_vertical_speed:
+        labels['v_speed'] = LABEL_FORMATS['v_speed'] % frame.v_speed
+    if config.show_camera_settings:
+        labels['iso'] = LABEL_FORMATS['iso'] % frame.iso
+        labels['shutter'] = LABEL_FORMATS['shutter'] % frame.shutter
+        labels['fnum'] = LABEL_FORMATS['fnum'] % frame.fnum
+        labels['ev'] = LABEL_FORMATS['ev'] % frame.ev
+    if config.show_coordinates:
+        labels['coordinates'] = _coordinates_label(frame.latitude, frame.longitude)
+    if config.show_timestamp:
+        labels['timestamp'] = _timestamp_label(frame.timestamp)
+    if config.show_speed_gauge:
+        labels['gauge_speed'] = LABEL_FORMATS['gauge_speed'] % (frame.h_speed * 3.6)
+    return labels
+
+
+def precompute_labels(telemetry: TelemetryData, config: Optional[OverlayConfig] = None) -> dict[str, list[str]]:
+    """
+    Format the overlay text of every telemetry frame up front.
+
+    Rendering many video frames per telemetry frame (or re-rendering the
+    same flight) then only looks labels up instead of formatting them.
+
+    Args:
+        telemetry: TelemetryData object with telemetry frames
+        config: Overlay configuration; only labels it shows are computed
+
+    Returns:
+        Dict mapping label name to one string per entry of telemetry.frames,
+        for OverlayRenderer.render(..., labels=labels, index=i)
+    """
+    config = config or OverlayConfig()
+    frames = telemetry.frames
+
+    def column(key: str, values) -> list[str]:
+        fmt = LABEL_FORMATS[key]
+        return [fmt % value for value in values]
+
+    labels = {}
+    if config.show_altitude:
+        labels['altitude'] = column('altitude', [f.rel_alt for f in frames])
+    if config.show_speed:
+        labels['h_speed'] = column('h_speed', [f.h_speed * 3.6 for f in frames])
+    if config.show_vertical_speed:
+        labels['v_speed'] = column('v_speed', [f.v_speed for f in frames])
+    if config.show_camera_settings:
+        labels['iso'] = column('iso', [f.iso for f in frames])
+        labels['shutter'] = column('shutter', [f.shutter for f in frames])
+        labels['fnum'] = column('fnum', [f.fnum for f in frames])
+        labels['ev'] = column('ev', [f.ev for f in frames])
+    if config.show_coordinates:
+        labels['coordinates'] = [_coordinates_label(f.latitude, f.longitude) for f in frames]
+    if config.show_timestamp:
+        labels['timestamp'] = [_timestamp_label(f.timestamp) for f in frames]
+    if config.show_speed_gauge:
+        labels['gauge_speed'] = column('gauge_speed', [f.h_speed * 3.6 for f in frames])
+    return labels
+
+
 class OverlayRenderer:
     """Renders telemetry overlay onto video frames."""
 
@@ -89,13 +180,21 @@ class OverlayRenderer:
         size = cv2.getTextSize(text, self.font, font_scale, self.thickness)[0]
         return size[0], size[1]
 
-    def render(self, telemetry: TelemetryFrame, frame: Optional[np.ndarray] = None) -> np.ndarray:
+    def render(
+        self,
+        telemetry: TelemetryFrame,
+        frame: Optional[np.ndarray] = None,
+        labels: Optional[dict[str, list[str]]] = None,
+        index: Optional[int] = None
+    ) -> np.ndarray:
         """
         Render telemetry overlay.
 
         Args:
             telemetry: Telemetry data for the current frame
             frame: Video frame to draw on (creates transparent if None)
+            labels: Labels from precompute_labels() for the same config
+            index: Index of telemetry in the TelemetryData the labels were built from
 
         Returns:
             Frame with telemetry overlay
@@ -108,6 +207,11 @@ class OverlayRenderer:
             overlay = frame.copy()
             is_transparent = False
 
+        if labels is not None and index is not None:
+            text = {key: values[index] for key, values in labels.items()}
+        else:
+            text = _frame_labels(telemetry, self.config)
+
         # Get color for drawing (handle transparent vs opaque)
         def get_color(bgr_color):
             if is_transparent:
@@ -121,63 +225,36 @@ class OverlayRenderer:
         y_pos = self.padding + self.line_height
 
         if self.config.show_altitude:
-            alt_text = f"ALT: {telemetry.rel_alt:.1f}m"
-            self._draw_text_with_shadow(overlay, alt_text, (self.padding, y_pos), self.font_scale_large)
+            self._draw_text_with_shadow(overlay, text['altitude'], (self.padding, y_pos), self.font_scale_large)
             y_pos += self.line_height
 
         if self.config.show_speed:
-            h_speed_kmh = telemetry.h_speed * 3.6
-            speed_text = f"H.SPD: {h_speed_kmh:.1f} km/h"
-            self._draw_text_with_shadow(overlay, speed_text, (self.padding, y_pos), self.font_scale_large)
+            self._draw_text_with_shadow(overlay, text['h_speed'], (self.padding, y_pos), self.font_scale_large)
             y_pos += self.line_height
 
         if self.config.show_vertical_speed:
-            v_speed_text = f"V.SPD: {telemetry.v_speed:+.1f} m/s"
-            self._draw_text_with_shadow(overlay, v_speed_text, (self.padding, y_pos), self.font_scale_large)
+            self._draw_text_with_shadow(overlay, text['v_speed'], (self.padding, y_pos), self.font_scale_large)
 
         # === TOP RIGHT: Camera Settings ===
         if self.config.show_camera_settings:
             y_pos = self.padding + self.line_height
             right_margin = self.width - self.padding
 
-            # ISO
-            iso_text = f"ISO {telemetry.iso}"
-            text_w, _ = self._get_text_size(iso_text, self.font_scale_small)
-            self._draw_text_with_shadow(overlay, iso_text,
-                                        (right_margin - text_w, y_pos), self.font_scale_small)
-            y_pos += self.line_height
-
-            # Shutter
-            shutter_text = f"{telemetry.shutter}s"
-            text_w, _ = self._get_text_size(shutter_text, self.font_scale_small)
-            self._draw_text_with_shadow(overlay, shutter_text,
-                                        (right_margin - text_w, y_pos), self.font_scale_small)
-            y_pos += self.line_height
-
-            # Aperture
-            fnum_text = f"f/{telemetry.fnum}"
-            text_w, _ = self._get_text_size(fnum_text, self.font_scale_small)
-            self._draw_text_with_shadow(overlay, fnum_text,
-                                        (right_margin - text_w, y_pos), self.font_scale_small)
-            y_pos += self.line_height
-
-            # EV
-            ev_text = f"EV {telemetry.ev:+.1f}"
-            text_w, _ = self._get_text_size(ev_text, self.font_scale_small)
-            self._draw_text_with_shadow(overlay, ev_text,
-                                        (right_margin - text_w, y_pos), self.font_scale_small)
+            # ISO, shutter, aperture and EV
+            for key in ('iso', 'shutter', 'fnum', 'ev'):
+                text_w, _ = self._get_text_size(text[key], self.font_scale_small)
+                self._draw_text_with_shadow(overlay, text[key],
+                                            (right_margin - text_w, y_pos), self.font_scale_small)
+                y_pos += self.line_height
 
         # === BOTTOM LEFT: GPS Coordinates ===
         if self.config.show_coordinates:
             y_pos = self.height - self.padding - self.line_height
-            lat_dir = "S" if telemetry.latitude < 0 else "N"
-            lon_dir = "W" if telemetry.longitude < 0 else "E"
-            coords_text = f"{abs(telemetry.latitude):.6f}{lat_dir}  {abs(telemetry.longitude):.6f}{lon_dir}"
-            self._draw_text_with_shadow(overlay, coords_text, (self.padding, y_pos), self.font_scale_small)
+            self._draw_text_with_shadow(overlay, text['coordinates'], (self.padding, y_pos), self.font_scale_small)
 
         # === BOTTOM RIGHT: Timestamp ===
-        if self.config.show_timestamp and telemetry.timestamp:
-            time_only = telemetry.timestamp.split(' ')[-1].split('.')[0]  # Get HH:MM:SS
+        if self.config.show_timestamp and text['timestamp']:
+            time_only = text['timestamp']  # HH:MM:SS
             text_w, _ = self._get_text_size(time_only, self.font_scale_small)
             self._draw_text_with_shadow(overlay, time_only,
                                         (self.width - self.padding - text_w,
@@ -186,11 +263,11 @@ class OverlayRenderer:
 
         # === BOTTOM CENTER: Speed Gauge ===
         if self.config.show_speed_gauge:
-            self._draw_speed_gauge(overlay, telemetry.h_speed * 3.6)
+            self._draw_speed_gauge(overlay, telemetry.h_speed * 3.6, text['gauge_speed'])
 
         return overlay
 
-    def _draw_speed_gauge(self, img: np.ndarray, speed_kmh: float):
+    def _draw_speed_gauge(self, img: np.ndarray, speed_kmh: float, speed_val_text: Optional[str] = None):
         """Draw the speed gauge at bottom center."""
         gauge_center_x = self.width // 2
         gauge_center_y = self.height - int(80 * self.scale_factor)
@@ -227,7 +304,8 @@ class OverlayRenderer:
                  needle_color, max(2, int(3 * self.scale_factor)), cv2.LINE_AA)
 
         # Speed value
-        speed_val_text = f"{speed_kmh:.0f}"
+        if speed_val_text is None:
+            speed_val_text = LABEL_FORMATS['gauge_speed'] % speed_kmh
         text_w, text_h = self._get_text_size(speed_val_text, self.font_scale_large)
         self._draw_text_with_shadow(img, speed_val_text,
                                     (gauge_center_x - text_w // 2,
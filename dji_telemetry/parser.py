@@ -2,8 +2,10 @@
 DJI SRT telemetry file parser.
 """
 
+import os
 import re
 import math
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -13,8 +15,8 @@ from typing import Optional
 class TelemetryFrame:
     """Telemetry data for a single frame."""
     frame_num: int
-    start_time_ms: float
-    end_time_ms: float
+    start_time_ms: int
+    end_time_ms: int
     timestamp: str
     iso: int
     shutter: str
@@ -53,6 +55,18 @@ class TelemetryFrame:
         }
 
 
+@dataclass
+class TelemetrySummary:
+    """Flight statistics for an SRT file, without the per-frame data."""
+    frame_count: int = 0
+    duration_seconds: float = 0.0
+    total_distance: float = 0.0
+    max_altitude: float = 0.0
+    max_speed: float = 0.0
+    start_coordinates: tuple[float, float] = (0.0, 0.0)
+    end_coordinates: tuple[float, float] = (0.0, 0.0)
+
+
 @dataclass
 class TelemetryData:
     """Container for all telemetry data from an SRT file."""
@@ -101,32 +115,61 @@ class TelemetryData:
             return (0.0, 0.0)
         return (self.frames[-1].latitude, self.frames[-1].longitude)
 
-    def get_frame_at_time(self, time_ms: float) -> Optional[TelemetryFrame]:
-        """Find the telemetry frame for a given video time."""
-        for frame in self.frames:
+    def summary(self) -> TelemetrySummary:
+        """Collect the flight statistics into a TelemetrySummary."""
+        return TelemetrySummary(
+            frame_count=len(self.frames),
+            duration_seconds=self.duration_seconds,
+            total_distance=self.total_distance,
+            max_altitude=self.max_altitude,
+            max_speed=self.max_speed,
+            start_coordinates=self.start_coordinates,
+            end_coordinates=self.end_coordinates,
+        )
+
+    def get_index_at_time(self, time_ms: float) -> Optional[int]:
+        """Find the index into frames of the telemetry frame for a given video time."""
+        for i, frame in enumerate(self.frames):
             if frame.start_time_ms <= time_ms < frame.end_time_ms:
-                return frame
+                return i
 
         if self.frames:
             if time_ms < self.frames[0].start_time_ms:
-                return self.frames[0]
+                return 0
             if time_ms >= self.frames[-1].end_time_ms:
-                return self.frames[-1]
+                return len(self.frames) - 1
 
         return None
 
+    def get_frame_at_time(self, time_ms: float) -> Optional[TelemetryFrame]:
+        """Find the telemetry frame for a given video time."""
+        index = self.get_index_at_time(time_ms)
+        return self.frames[index] if index is not None else None
+
     def to_list(self) -> list[dict]:
         """Convert all frames to list of dictionaries."""
         return [f.to_dict() for f in self.frames]
 
 
-def _parse_time_to_ms(time_str: str) -> float:
+# Read size for streaming SRT scans
+SRT_READ_SIZE = 64 * 1024
+
+# Fields needed for flight statistics, matched in a single pass over the raw bytes.
+# Alternatives start with a literal so the scan skips ahead quickly.
+_SUMMARY_PATTERN = re.compile(
+    rb'\n(\d+):(\d+):(\d+),(\d+)\s*-->\s*(\d+):(\d+):(\d+),(\d+)'
+    rb'|\[(latitude|longitude):\s*([+-]?[\d.]+)\]'
+    rb'|\[rel_alt:\s*([\d.]+)'
+)
+
+
+def _parse_time_to_ms(time_str: str) -> int:
     """Convert SRT time format (HH:MM:SS,mmm) to milliseconds."""
     match = re.match(r"(\d+):(\d+):(\d+),(\d+)", time_str)
     if match:
         h, m, s, ms = map(int, match.groups())
         return (h * 3600 + m * 60 + s) * 1000 + ms
-    return 0.0
+    return 0
 
 
 def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -145,6 +188,129 @@ def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
     return R * c
 
 
+def _advise_sequential(f):
+    """Hint the kernel that an open file is read front to back (larger readahead)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _to_float(value: bytes) -> float:
+    """Parse a matched number, defaulting to 0 like parse_srt."""
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _iter_srt_summary_fields(srt_path: Path):
+    """Yield (start_ms, end_ms, latitude, longitude, rel_alt) per SRT block, streaming the file."""
+    frame = None
+    tail = b'\n'  # time lines are matched with their preceding newline
+
+    with open(srt_path, 'rb') as f:
+        _advise_sequential(f)
+        while True:
+            chunk = f.read(SRT_READ_SIZE)
+            data = tail + chunk
+            if chunk:
+                # Fields never span lines; the last newline starts the next scan
+                cut = data.rfind(b'\n')
+                data, tail = data[:cut], data[cut:]
+
+            for match in _SUMMARY_PATTERN.finditer(data):
+                group = match.lastindex
+                if group == 8:
+                    if frame is not None:
+                        yield tuple(frame)
+                    h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match.groups()[:8])
+                    frame = [(h1 * 3600 + m1 * 60 + s1) * 1000 + ms1,
+                             (h2 * 3600 + m2 * 60 + s2) * 1000 + ms2, 0.0, 0.0, 0.0]
+                elif frame is not None:
+                    if group == 10:
+                        frame[2 if match.group(9) == b'latitude' else 3] = _to_float(match.group(10))
+                    else:
+                        frame[4] = _to_float(match.group(11))
+
+            if not chunk:
+                break
+
+    if frame is not None:
+        yield tuple(frame)
+
+
+def parse_srt_summary(srt_path: str | Path, smooth_speeds: bool = True, window_size: int = 15) -> TelemetrySummary:
+    """
+    Compute flight statistics for a DJI SRT file without parsing every frame.
+
+    The file is streamed once and only the time range, coordinates and
+    altitude of each block are extracted; speeds are derived and smoothed
+    over a sliding window, matching parse_srt(...).summary() for files whose
+    blocks are in frame order (as DJI writes them).
+
+    Args:
+        srt_path: Path to the SRT file
+        smooth_speeds: Apply moving average smoothing to speed calculations
+        window_size: Window size for speed smoothing
+
+    Returns:
+        TelemetrySummary with the flight statistics
+    """
+    half = window_size // 2
+    recent = deque(maxlen=2 * half + 1)  # last raw speeds, for the centered moving average
+    count = 0
+    raw_max = smooth_max = 0.0
+    total_distance = max_altitude = 0.0
+    first = last = None
+
+    def smoothed(window) -> float:
+        return sum(window) / len(window)
+
+    for start_ms, end_ms, lat, lon, rel_alt in _iter_srt_summary_fields(Path(srt_path)):
+        h_speed = 0.0
+        if last is not None:
+            dt = (start_ms - last[0]) / 1000.0
+            if dt <= 0:
+                dt = 0.033  # ~30fps fallback
+            h_dist = _haversine_distance(last[2], last[3], lat, lon)
+            h_speed = h_dist / dt
+            total_distance += h_dist
+        else:
+            first = (lat, lon)
+
+        max_altitude = max(max_altitude, rel_alt)
+        raw_max = max(raw_max, h_speed)
+        last = (start_ms, end_ms, lat, lon)
+        count += 1
+
+        # Frame count - 1 - half now has every speed its window needs
+        recent.append(h_speed)
+        if count > half:
+            i = count - 1 - half
+            window = list(recent)[-(min(i, half) + half + 1):]
+            smooth_max = max(smooth_max, smoothed(window))
+
+    if count == 0:
+        return TelemetrySummary()
+
+    # Trailing frames whose windows are clipped at the end of the file
+    for i in range(max(0, count - half), count):
+        window = list(recent)[-(count - max(0, i - half)):]
+        smooth_max = max(smooth_max, smoothed(window))
+
+    return TelemetrySummary(
+        frame_count=count,
+        duration_seconds=last[1] / 1000.0,
+        total_distance=total_distance,
+        max_altitude=max_altitude,
+        max_speed=smooth_max if smooth_speeds and count > window_size else raw_max,
+        start_coordinates=first,
+        end_coordinates=(last[2], last[3]),
+    )
+
+
 def parse_srt(srt_path: str | Path, smooth_speeds: bool = True, window_size: int = 15) -> TelemetryData:
     """
     Parse a DJI SRT file and extract telemetry data.
@@ -161,6 +327,7 @@ def parse_srt(srt_path: str | Path, smooth_speeds: bool = True, window_size: int
     frames = []
 
     with open(srt_path, 'r', encoding='utf-8') as f:
+        _advise_sequential(f)
         content = f.read()
 
     # Split into subtitle blocks
@@ -196,7 +363,7 @@ def parse_srt(srt_path: str | Path, smooth_speeds: bool = True, window_size: int
         timestamp = timestamp_match.group(1) if timestamp_match else ""
 
         # Extract values using regex
-        def extract_value(pattern: str, default=0):
+        def extract_value(pattern: str, default=0.0):
             match = re.search(pattern, metadata_text)
             if match:
                 try:
@@ -2,9 +2,14 @@
 Video processing for telemetry overlay.
 """
 
+import queue
 import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util as mp_util
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator, Optional
 
 import cv2
 import numpy as np
@@ -12,13 +17,311 @@ import numpy as np
 from .parser import TelemetryData
 from .overlay import OverlayConfig, OverlayRenderer
 
+# _uring loads liburing, so it is only imported once io_uring writes are requested
+if TYPE_CHECKING:
+    from . import _uring
+
+
+# Rendered frames buffered between the renderer and the ffmpeg writer thread
+PIPE_QUEUE_SIZE = 8
+
+# Contiguous frames handed to a render worker per task
+RENDER_CHUNK_SIZE = 16
+
+# Encoder settings for NVIDIA hardware encoders (h264_nvenc, hevc_nvenc)
+NVENC_ARGS = ['-preset', 'p4', '-tune', 'hq', '-b:v', '50M']
+
+# Per-process renderer state, set up once by _init_render_worker
+_worker_state = None
+
+
+def _iter_overlay_frames(
+    telemetry: TelemetryData,
+    renderer: OverlayRenderer,
+    fps: float,
+    frame_nums: Iterable[int],
+    labels: Optional[dict[str, list[str]]] = None,
+    reuse_overlays: bool = True
+) -> Iterator[np.ndarray]:
+    """
+    Yield a transparent BGRA overlay for each output frame.
+
+    Telemetry usually updates slower than the video frame rate; with
+    reuse_overlays, consecutive frames that map to the same telemetry frame
+    get the same rendered array, so consumers must not modify it.
+    """
+    last_index = last_overlay = None
+
+    for frame_num in frame_nums:
+        current_time_ms = (frame_num / fps) * 1000
+        index = telemetry.get_index_at_time(current_time_ms)
+
+        if reuse_overlays and last_overlay is not None and index == last_index:
+            yield last_overlay
+            continue
+
+        if index is not None:
+            overlay = renderer.render(telemetry.frames[index], None, labels, index)
+        else:
+            overlay = np.zeros((renderer.height, renderer.width, 4), dtype=np.uint8)
+
+        last_index, last_overlay = index, overlay
+        yield overlay
+
+
+def _init_render_worker(
+    telemetry: TelemetryData,
+    width: int,
+    height: int,
+    fps: float,
+    config: Optional[OverlayConfig],
+    labels: Optional[dict[str, list[str]]],
+    async_io: bool = False
+):
+    """Build the renderer (and, with async_io, the io_uring writer) once per worker process."""
+    global _worker_state
+    writer = None
+    if async_io:
+        from . import _uring
+
+        writer = _uring.UringWriter()
+        # Runs when the worker exits at pool shutdown
+        mp_util.Finalize(None, writer.close, exitpriority=10)
+    _worker_state = (telemetry, OverlayRenderer(width, height, config), fps, labels, writer)
+
+
+def _save_frames(
+    frames: Iterable[np.ndarray],
+    frame_nums: Iterable[int],
+    output_dir: Path,
+    format: str,
+    writer: Optional['_uring.UringWriter'] = None
+) -> Iterator[int]:
+    """
+    Save overlay frames as numbered image files, yielding each frame number.
+
+    With a writer, frames are encoded in memory and their file writes are
+    queued on its io_uring; call writer.flush() to wait for them.
+    """
+    for frame_num, overlay in zip(frame_nums, frames):
+        path = output_dir / f"frame_{frame_num:06d}.{format}"
+        if writer is None:
+            cv2.imwrite(str(path), overlay)
+        else:
+            ok, encoded = cv2.imencode(f'.{format}', overlay)
+            if not ok:
+                raise IOError(f"Could not encode frame {frame_num} as {format}")
+            writer.write_file(path, encoded)
+        yield frame_num
+
+
+def _save_frame_range(frame_nums: range, output_dir: Path, format: str) -> int:
+    """Render a contiguous range of overlay frames to image files in a worker process."""
+    telemetry, renderer, fps, labels, writer = _worker_state
+    frames = _iter_overlay_frames(telemetry, renderer, fps, frame_nums, labels)
+    for _ in _save_frames(frames, frame_nums, output_dir, format, writer):
+        pass
+    if writer is not None:
+        # The chunk only counts as saved once its files are written
+        writer.flush()
+    return len(frame_nums)
+
+
+def _frame_chunks(total_frames: int) -> list[range]:
+    """Split the output frame indices into contiguous chunks."""
+    return [range(start, min(start + RENDER_CHUNK_SIZE, total_frames))
+            for start in range(0, total_frames, RENDER_CHUNK_SIZE)]
+
+
+def _render_pool(
+    telemetry: TelemetryData,
+    width: int,
+    height: int,
+    fps: float,
+    config: Optional[OverlayConfig],
+    jobs: int,
+    labels: Optional[dict[str, list[str]]] = None,
+    async_io: bool = False
+) -> ProcessPoolExecutor:
+    """Create a process pool whose workers each hold their own renderer and writer."""
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_render_worker,
+        initargs=(telemetry, width, height, fps, config, labels, async_io)
+    )
+
+
+def _overlay_frames(
+    telemetry: TelemetryData,
+    width: int,
+    height: int,
+    fps: float,
+    total_frames: int,
+    config: Optional[OverlayConfig] = None,
+    labels: Optional[dict[str, list[str]]] = None
+) -> Iterator[np.ndarray]:
+    """
+    Yield overlay frames in order, rendered in this process.
+
+    Streamed output (pipes, video writers) is never rendered in a worker
+    pool: shipping full BGRA frames back to the parent costs far more than
+    rendering them.
+    """
+    renderer = OverlayRenderer(width, height, config)
+    yield from _iter_overlay_frames(telemetry, renderer, fps, range(total_frames), labels)
+
+
+def _write_frames(
+    sink: BinaryIO,
+    frames: Iterator[np.ndarray],
+    total_frames: int,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+):
+    """
+    Write frames to sink from a worker thread while the caller keeps rendering.
+
+    Frames are passed to sink.write() as-is through the buffer protocol, so they
+    must be C-contiguous and not modified after being yielded.
+
+    Raises the first error hit by the writer (e.g. BrokenPipeError when ffmpeg
+    exits early) once rendering has stopped.
+    """
+    buffers = queue.Queue(maxsize=PIPE_QUEUE_SIZE)
+    errors = []
+
+    def writer():
+        while True:
+            buf = buffers.get()
+            if buf is None:
+                return
+            if errors:
+                continue
+            try:
+                sink.write(buf)
+            except OSError as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+
+    try:
+        for frame_num, frame in enumerate(frames, 1):
+            if errors:
+                break
+            buffers.put(frame)
+
+            if progress_callback:
+                progress_callback(frame_num, total_frames)
+    finally:
+        buffers.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _check_even_size(width: int, height: int):
+    """Raise ValueError unless width and height are even, as 4:2:0 video requires."""
+    if width % 2 or height % 2:
+        raise ValueError(f"Frame size {width}x{height} is not supported: "
+                         f"yuv420p video needs an even width and height")
+
+
+def _convert_frames(frames: Iterable[np.ndarray], pix_fmt: str) -> Iterator[np.ndarray]:
+    """
+    Convert BGRA overlay frames to the raw pixel format piped to ffmpeg.
+
+    yuv420p drops alpha (I420 planes, 1.5 bytes per pixel); yuva420p appends
+    the alpha plane (2.5 bytes per pixel); bgra passes frames through.
+    Repeated (reused) overlays are converted only once.
+    """
+    if pix_fmt == 'bgra':
+        yield from frames
+        return
+
+    last_frame = last_converted = None
+    for frame in frames:
+        if frame is not last_frame:
+            height, width = frame.shape[:2]
+            converted = np.empty(width * height * (5 if pix_fmt == 'yuva420p' else 3) // 2, dtype=np.uint8)
+
+            planes = converted[:width * height * 3 // 2].reshape(height * 3 // 2, width)
+            cv2.cvtColor(frame, cv2.COLOR_BGRA2YUV_I420, dst=planes)
+            if pix_fmt == 'yuva420p':
+                converted[width * height * 3 // 2:].reshape(height, width)[:] = frame[:, :, 3]
+
+            last_frame, last_converted = frame, converted
+        yield last_converted
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_encoders(ffmpeg_path: str) -> frozenset:
+    """Names of the encoders built into ffmpeg, probed once per executable."""
+    try:
+        result = subprocess.run([ffmpeg_path, '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # Encoder lines follow the legend: " V....D libx264   libx264 H.264 / AVC ..."
+    listing = result.stdout.partition('------')[2]
+    return frozenset(line.split()[1] for line in listing.splitlines() if len(line.split()) > 1)
+
+
+def has_encoder(codec: str, ffmpeg_path: str = 'ffmpeg') -> bool:
+    """
+    Check whether ffmpeg was built with a video encoder.
+
+    Args:
+        codec: ffmpeg encoder name (e.g. 'h264_nvenc')
+        ffmpeg_path: Path to ffmpeg executable
+
+    Returns:
+        True if ffmpeg lists the encoder (NVENC still needs a usable GPU at runtime)
+    """
+    return codec in _ffmpeg_encoders(ffmpeg_path)
+
+
+def _encoder_args(codec: str, ffmpeg_path: str) -> list[str]:
+    """ffmpeg video encoder arguments, falling back to libx264 when codec is unavailable."""
+    if codec != 'libx264' and not has_encoder(codec, ffmpeg_path):
+        codec = 'libx264'
+
+    if codec.endswith('_nvenc'):
+        return ['-c:v', codec, *NVENC_ARGS]
+    return ['-c:v', codec, '-preset', 'ultrafast']
+
+
+def _open_capture(video_path: Path) -> cv2.VideoCapture:
+    """
+    Open a video for decoding.
+
+    Raises FileNotFoundError if the file does not exist (the file is only
+    stat-ed after OpenCV fails to open it) and IOError for any other failure.
+    """
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        raise IOError(f"Could not open video file: {video_path}")
+    return cap
+
+
+def _frame_skip(source_fps: float, sample_fps: Optional[float]) -> int:
+    """Number of source frames per output frame when sampling below the source rate."""
+    if sample_fps and 0 < sample_fps < source_fps:
+        return max(1, round(source_fps / sample_fps))
+    return 1
+
 
 def process_video(
     video_path: str | Path,
     telemetry: TelemetryData,
     output_path: str | Path,
     config: Optional[OverlayConfig] = None,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    sample_fps: Optional[float] = None,
+    labels: Optional[dict[str, list[str]]] = None
 ) -> Path:
     """
     Process a video file and add telemetry overlay.
@@ -29,6 +332,10 @@ def process_video(
         output_path: Path to output video file
         config: Overlay configuration (uses defaults if None)
         progress_callback: Optional callback function(current_frame, total_frames)
+        sample_fps: Output frame rate; when lower than the source rate, only every
+            Nth frame is retrieved, overlaid and written; the others are still
+            decoded by grab() (None keeps every frame)
+        labels: Overlay text from precompute_labels() (formatted per frame if None)
 
     Returns:
         Path to the output video file
@@ -36,9 +343,7 @@ def process_video(
     video_path = Path(video_path)
     output_path = Path(output_path)
 
-    cap = cv2.VideoCapture(str(video_path))
-    if not cap.isOpened():
-        raise IOError(f"Could not open video file: {video_path}")
+    cap = _open_capture(video_path)
 
     # Get video properties
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -46,20 +351,31 @@ def process_video(
     fps = cap.get(cv2.CAP_PROP_FPS)
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
+    skip = _frame_skip(fps, sample_fps)
+    total_output = -(-total_frames // skip)
+
     # Create overlay renderer
     renderer = OverlayRenderer(width, height, config)
 
     # Create video writer
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(str(output_path), fourcc, fps, (width, height))
+    out = cv2.VideoWriter(str(output_path), fourcc, fps / skip, (width, height))
 
     if not out.isOpened():
         cap.release()
         raise IOError(f"Could not create output video: {output_path}")
 
     frame_num = 0
+    written = 0
     while True:
-        ret, video_frame = cap.read()
+        # Skipped frames are grabbed (decoded) but never retrieved, converted or overlaid
+        if not cap.grab():
+            break
+        if frame_num % skip != 0:
+            frame_num += 1
+            continue
+
+        ret, video_frame = cap.retrieve()
         if not ret:
             break
 
@@ -67,16 +383,17 @@ def process_video(
         current_time_ms = (frame_num / fps) * 1000
 
         # Get telemetry for current time
-        telem_frame = telemetry.get_frame_at_time(current_time_ms)
+        index = telemetry.get_index_at_time(current_time_ms)
 
-        if telem_frame:
-            video_frame = renderer.render(telem_frame, video_frame)
+        if index is not None:
+            video_frame = renderer.render(telemetry.frames[index], video_frame, labels, index)
 
         out.write(video_frame)
         frame_num += 1
+        written += 1
 
         if progress_callback:
-            progress_callback(frame_num, total_frames)
+            progress_callback(written, total_output)
 
     cap.release()
     out.release()
@@ -84,6 +401,107 @@ def process_video(
     return output_path
 
 
+def process_video_ffmpeg(
+    video_path: str | Path,
+    telemetry: TelemetryData,
+    output_path: str | Path,
+    config: Optional[OverlayConfig] = None,
+    audio: bool = False,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    ffmpeg_path: str = 'ffmpeg',
+    sample_fps: Optional[float] = None,
+    labels: Optional[dict[str, list[str]]] = None,
+    reuse_overlays: bool = True,
+    pix_fmt: str = 'yuva420p',
+    codec: str = 'libx264'
+) -> Path:
+    """
+    Process a video file and add telemetry overlay in a single ffmpeg pass.
+
+    Transparent overlay frames are piped into ffmpeg, which decodes the source
+    video, composites the overlay and encodes the result (optionally copying
+    the original audio) without any intermediate file. The yuv420p output
+    needs an even video width and height; odd sizes raise ValueError.
+
+    Args:
+        video_path: Path to input video file
+        telemetry: TelemetryData object with telemetry frames
+        output_path: Path to output video file
+        config: Overlay configuration (uses defaults if None)
+        audio: Copy the audio track from the input video
+        progress_callback: Optional callback function(current_frame, total_frames)
+        ffmpeg_path: Path to ffmpeg executable
+        sample_fps: Output frame rate; when lower than the source rate, ffmpeg
+            still decodes every frame and its fps filter drops the extra ones
+            before compositing (None keeps every frame)
+        labels: Overlay text from precompute_labels() (formatted per frame if None)
+        reuse_overlays: Render once per telemetry frame and resend the same overlay
+            while the telemetry frame is unchanged (False renders every video frame)
+        pix_fmt: Pixel format of the overlay frames piped to ffmpeg: 'yuva420p'
+            (smaller, used by the overlay filter as-is) or 'bgra'
+        codec: ffmpeg video encoder, e.g. 'h264_nvenc' or 'hevc_nvenc' to encode
+            on an NVIDIA GPU (falls back to libx264 if ffmpeg lacks it)
+
+    Returns:
+        Path to the output video file
+    """
+    video_path = Path(video_path)
+    output_path = Path(output_path)
+
+    info = get_video_info(video_path)
+    width, height = info['width'], info['height']
+
+    skip = _frame_skip(info['fps'], sample_fps)
+    fps = info['fps'] / skip
+    total_frames = -(-info['frame_count'] // skip)
+
+    if skip > 1:
+        base_filter = f'[0:v]fps={fps}[base];[base][1:v]overlay[v]'
+    else:
+        base_filter = '[0:v][1:v]overlay[v]'
+
+    _check_even_size(width, height)
+    renderer = OverlayRenderer(width, height, config)
+
+    cmd = [
+        ffmpeg_path, '-y',
+        '-hide_banner', '-loglevel', 'error',
+        '-i', str(video_path),
+        '-f', 'rawvideo',
+        '-pix_fmt', pix_fmt,
+        '-s', f'{width}x{height}',
+        '-r', str(fps),
+        '-i', '-',
+        '-filter_complex', base_filter,
+        '-map', '[v]',
+    ]
+    if audio:
+        cmd += ['-map', '0:a?', '-c:a', 'copy']
+    cmd += _encoder_args(codec, ffmpeg_path)
+    cmd += ['-pix_fmt', 'yuv420p', str(output_path)]
+
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=1 << 20)
+
+    try:
+        frames = _iter_overlay_frames(telemetry, renderer, fps, range(total_frames),
+                                      labels, reuse_overlays)
+        frames = _convert_frames(frames, pix_fmt)
+        _write_frames(proc.stdin, frames, total_frames, progress_callback)
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its status is reported below
+        proc.wait()
+
+    if proc.returncode != 0:
+        raise IOError(f"ffmpeg exited with status {proc.returncode}")
+
+    return output_path
+
+
 def generate_overlay_video(
     telemetry: TelemetryData,
     output_path: str | Path,
@@ -91,7 +509,8 @@ def generate_overlay_video(
     height: int = 1080,
     fps: float = 30.0,
     config: Optional[OverlayConfig] = None,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    labels: Optional[dict[str, list[str]]] = None
 ) -> Path:
     """
     Generate a transparent overlay video with just telemetry graphics.
@@ -104,6 +523,7 @@ def generate_overlay_video(
         fps: Frames per second
         config: Overlay configuration (uses defaults if None)
         progress_callback: Optional callback function(current_frame, total_frames)
+        labels: Overlay text from precompute_labels() (formatted per frame if None)
 
     Returns:
         Path to the output video file
@@ -115,9 +535,6 @@ def generate_overlay_video(
     """
     output_path = Path(output_path)
 
-    # Create overlay renderer
-    renderer = OverlayRenderer(width, height, config)
-
     # Calculate total frames from telemetry duration
     duration_ms = telemetry.duration_seconds * 1000
     total_frames = int((duration_ms / 1000.0) * fps)
@@ -144,24 +561,16 @@ def generate_overlay_video(
     if not out.isOpened():
         raise IOError(f"Could not create output video: {output_path}")
 
-    for frame_num in range(total_frames):
-        current_time_ms = (frame_num / fps) * 1000
-        telem_frame = telemetry.get_frame_at_time(current_time_ms)
-
-        if telem_frame:
-            # Render on transparent background
-            overlay = renderer.render(telem_frame, None)
-
-            if use_alpha:
-                out.write(overlay)
-            else:
-                # Convert BGRA to BGR with black background
-                bgr_frame = cv2.cvtColor(overlay, cv2.COLOR_BGRA2BGR)
-                out.write(bgr_frame)
+    # Frames without telemetry come back fully transparent, i.e. black once converted
+    frames = _overlay_frames(telemetry, width, height, fps, total_frames, config, labels)
+
+    for frame_num, overlay in enumerate(frames):
+        if use_alpha:
+            out.write(overlay)
         else:
-            # Write black frame
-            black_frame = np.zeros((height, width, 3), dtype=np.uint8)
-            out.write(black_frame)
+            # Convert BGRA to BGR with black background
+            bgr_frame = cv2.cvtColor(overlay, cv2.COLOR_BGRA2BGR)
+            out.write(bgr_frame)
 
         if progress_callback:
             progress_callback(frame_num + 1, total_frames)
@@ -179,7 +588,12 @@ def generate_overlay_frames(
     fps: float = 30.0,
     config: Optional[OverlayConfig] = None,
     format: str = 'png',
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    sink: Optional[BinaryIO] = None,
+    jobs: int = 1,
+    async_io: bool = False,
+    labels: Optional[dict[str, list[str]]] = None,
+    pix_fmt: str = 'bgra'
 ) -> Path:
     """
     Generate transparent overlay frames as individual images.
@@ -187,6 +601,10 @@ def generate_overlay_frames(
     This is useful for compositing in video editors that support image sequences
     with alpha channels.
 
+    When ``sink`` is given, frames are written to it as raw BGRA buffers instead
+    of being encoded to image files (e.g. the stdin of an ffmpeg process opened
+    with ``open_ffmpeg_writer``), and nothing is written to ``output_dir``.
+
     Args:
         telemetry: TelemetryData object with telemetry frames
         output_dir: Directory to save frame images
@@ -196,34 +614,117 @@ def generate_overlay_frames(
         config: Overlay configuration (uses defaults if None)
         format: Image format ('png' recommended for transparency)
         progress_callback: Optional callback function(current_frame, total_frames)
+        sink: Optional binary file-like object receiving raw BGRA frames
+        jobs: Number of worker processes rendering and saving image files
+            (1 renders in-process); frames for a sink are always rendered in-process
+        async_io: Batch image file writes through io_uring (OSError unless
+            _uring.available())
+        labels: Overlay text from precompute_labels() (formatted per frame if None)
+        pix_fmt: Raw pixel format written to sink, matching open_ffmpeg_writer():
+            'bgra', 'yuv420p' or 'yuva420p' (the 4:2:0 formats need an even
+            width and height, else ValueError is raised)
 
     Returns:
         Path to the output directory
     """
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if sink is None and async_io:
+        from . import _uring
 
-    renderer = OverlayRenderer(width, height, config)
+        if not _uring.available():
+            # Checked up front so the pool doesn't fail in every worker's initializer instead
+            raise OSError("io_uring writes are not available on this system")
+    if sink is None:
+        output_dir.mkdir(parents=True, exist_ok=True)
 
     duration_ms = telemetry.duration_seconds * 1000
     total_frames = int((duration_ms / 1000.0) * fps)
 
-    for frame_num in range(total_frames):
-        current_time_ms = (frame_num / fps) * 1000
-        telem_frame = telemetry.get_frame_at_time(current_time_ms)
+    if sink is not None:
+        if pix_fmt != 'bgra':
+            _check_even_size(width, height)
+        frames = _overlay_frames(telemetry, width, height, fps, total_frames, config, labels)
+        frames = _convert_frames(frames, pix_fmt)
+        _write_frames(sink, frames, total_frames, progress_callback)
+        return output_dir
+
+    if jobs > 1:
+        # Workers encode and save their own frames; only counts come back
+        with _render_pool(telemetry, width, height, fps, config, jobs, labels, async_io) as executor:
+            chunks = _frame_chunks(total_frames)
+            done = 0
+            for saved in executor.map(_save_frame_range, chunks, [output_dir] * len(chunks),
+                                      [format] * len(chunks)):
+                done += saved
+                if progress_callback:
+                    progress_callback(done, total_frames)
+        return output_dir
+
+    frames = _overlay_frames(telemetry, width, height, fps, total_frames, config, labels)
+
+    if not async_io:
+        for frame_num in _save_frames(frames, range(total_frames), output_dir, format):
+            if progress_callback:
+                progress_callback(frame_num + 1, total_frames)
+        return output_dir
+
+    with _uring.UringWriter() as writer:
+        for frame_num in _save_frames(frames, range(total_frames), output_dir, format, writer):
+            if progress_callback:
+                progress_callback(frame_num + 1, total_frames)
 
-        if telem_frame:
-            overlay = renderer.render(telem_frame, None)
-        else:
-            overlay = np.zeros((height, width, 4), dtype=np.uint8)
+    return output_dir
 
-        frame_path = output_dir / f"frame_{frame_num:06d}.{format}"
-        cv2.imwrite(str(frame_path), overlay)
 
-        if progress_callback:
-            progress_callback(frame_num + 1, total_frames)
+def open_ffmpeg_writer(
+    output_path: str | Path,
+    width: int,
+    height: int,
+    fps: float,
+    codec: str = 'libx264',
+    ffmpeg_path: str = 'ffmpeg',
+    pix_fmt: str = 'bgra'
+) -> subprocess.Popen:
+    """
+    Start an ffmpeg process that encodes raw frames read from its stdin.
 
-    return output_dir
+    Write each frame with ``proc.stdin.write(frame.tobytes())`` (or pass
+    ``proc.stdin`` as the sink of generate_overlay_frames() with the same
+    pix_fmt), then close ``proc.stdin`` and call ``proc.wait()`` to finish the file.
+    The yuv420p output needs an even width and height; odd sizes raise ValueError.
+
+    Args:
+        output_path: Path to output video file
+        width: Frame width in pixels
+        height: Frame height in pixels
+        fps: Frames per second
+        codec: ffmpeg video encoder name (falls back to libx264 if ffmpeg lacks it;
+            NVENC encoders get NVENC_ARGS)
+        ffmpeg_path: Path to ffmpeg executable
+        pix_fmt: Pixel format of the frames written to stdin: 'bgra', or the
+            smaller 'yuv420p' that the encoder takes without conversion
+
+    Returns:
+        The running ffmpeg process
+    """
+    output_path = Path(output_path)
+    _check_even_size(width, height)
+
+    cmd = [
+        ffmpeg_path, '-y',
+        '-hide_banner', '-loglevel', 'error',
+        '-f', 'rawvideo',
+        '-pix_fmt', pix_fmt,
+        '-s', f'{width}x{height}',
+        '-r', str(fps),
+        '-i', '-',
+        *_encoder_args(codec, ffmpeg_path),
+        '-pix_fmt', 'yuv420p',
+        str(output_path)
+    ]
+
+    # A large pipe buffer keeps the renderer from stalling on every write
+    return subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=1 << 20)
 
 
 def add_audio(
@@ -282,9 +783,7 @@ def get_video_info(video_path: str | Path) -> dict:
     """
     video_path = Path(video_path)
 
-    cap = cv2.VideoCapture(str(video_path))
-    if not cap.isOpened():
-        raise IOError(f"Could not open video file: {video_path}")
+    cap = _open_capture(video_path)
 
     info = {
         'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),